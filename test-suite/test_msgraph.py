@@ -12,20 +12,30 @@ This test suite covers:
 - Network resilience and performance
 
 Note: Authentication testing is handled separately by auth test suites
+Every scenario runs against mocked httpx/EmailValidator doubles; no live Graph API calls are made
 Run this before production deployments to catch Graph API integration failure scenarios
 """
 
 import asyncio
+import atexit
+import functools
+import itertools
 import os
 import sys
 import logging
+import logging.handlers
+import math
 import json
+import queue
+import ssl
+import time
+import tracemalloc
+from collections import Counter
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-from unittest.mock import AsyncMock, Mock, patch, MagicMock
+from dataclasses import asdict, dataclass
+from unittest.mock import AsyncMock, Mock, patch, MagicMock, create_autospec
 import tempfile
-import shutil
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -37,6 +47,12 @@ from dotenv import load_dotenv
 import httpx
 import pytest
 
+# orjson is optional; fixture payloads fall back to the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import our components
 from auth.auth_helpers import MSGraphTokenManager, EmailValidator
 from clients.graph_api_client import (
@@ -55,19 +71,164 @@ load_dotenv()
 # Ensure logs directory exists
 os.makedirs('logs', exist_ok=True)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('logs/msgraph-test.log')
-    ]
-)
+# Configure logging. Records are handed to a queue and written to the console
+# and log file by a background listener, so logging calls inside tests never
+# block on stream/file I/O. basicConfig is a no-op when the importer (app.py)
+# has already configured logging, so the listener is only started, once, if
+# the queue handler actually went onto the root logger. It is stopped at
+# interpreter exit; suite runs never start, stop or join it themselves.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_queue = queue.SimpleQueue()
+_log_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler('logs/msgraph-test.log', delay=True)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter())  # merge args only; listener formats
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+if _queue_handler in logging.getLogger().handlers:
+    _log_listener.start()
+    atexit.register(_log_listener.stop)  # flushes queued records before logging shuts down
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class FakeResponse:
+    """Plain stand-in for the httpx.Response attributes MSGraphClient reads"""
+    status_code: int = 200
+    is_success: bool = True
+    text: str = ""
+    payload: Any = None
+
+    def json(self) -> Any:
+        return self.payload
+
+
+# Canned responses for the shapes most tests share; tests only read them
+_OK_EMPTY_LIST = FakeResponse(status_code=200, is_success=True, text='{"value": []}', payload={"value": []})
+
+_ACCEPTED_202 = FakeResponse(status_code=202, is_success=True)
+
+# MSGraphClient raises on 401 before reading the body, so no text/json payload
+_UNAUTHORIZED_401 = FakeResponse(status_code=401, is_success=False)
+
+_NOT_FOUND_404 = FakeResponse(status_code=404, is_success=False, text="Email not found", payload={"error": {"message": "Email not found"}})
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a fixture payload to the JSON text a response body would carry"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _write_report(path: str, payload: Dict[str, Any]) -> None:
+    """Write the JSON report, serializing TestResult dataclasses directly"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(payload, f, indent=2, default=asdict)
+
+
+# 1MB email body, allocated once rather than on every large-content test run
+_LARGE_BODY = "A" * (1 << 20)
+
+# Keep tracemalloc's own bookkeeping out of snapshot comparisons
+_TRACEMALLOC_FILTERS = (tracemalloc.Filter(False, tracemalloc.__file__),)
+
+# Case tables shared by every suite run
+_HTTP_ERROR_STATUS_CODES = (400, 401, 403, 404, 429, 500, 502, 503)
+_INVALID_EMAILS = (
+    "",
+    "invalid-email",
+    "@example.com",
+    "user@",
+    "user..user@example.com",
+    "user@example..com",
+    None
+)
+_IMPORTANCE_LEVELS = (EmailImportance.LOW, EmailImportance.NORMAL, EmailImportance.HIGH)
+_EDGE_CASE_EMAILS = (
+    "test+tag@example.com",  # Plus addressing
+    "test.dot@example.com",  # Dot in local part
+    "test@sub.example.com",  # Subdomain
+    "very.long.email.address.with.many.dots@very.long.domain.name.com",  # Long email
+)
+_SEARCH_CASES = (
+    {"query": "test"},
+    {"sender": "test@example.com"},
+    {"subject_filter": "important"},
+    {"has_attachments": True},
+    {"unread_only": True},
+    {"query": "project", "sender": "boss@company.com", "has_attachments": False}
+)
+_CONCURRENT_REQUESTS = 5
+# None/empty IDs should fail before any API call, so only the rest are looked up
+_INVALID_EMAIL_IDS = ("invalid-id", "nonexistent-id")
+
+# Minimum successes for the 80% success-rate checks, fixed with their case tables
+_HTTP_ERROR_STATUS_THRESHOLD = math.ceil(len(_HTTP_ERROR_STATUS_CODES) * 0.8)
+_INVALID_EMAILS_THRESHOLD = math.ceil(len(_INVALID_EMAILS) * 0.8)
+_EDGE_CASE_THRESHOLD = math.ceil(len(_EDGE_CASE_EMAILS) * 0.8)
+_SEARCH_THRESHOLD = math.ceil(len(_SEARCH_CASES) * 0.8)
+_CONCURRENT_THRESHOLD = math.ceil(_CONCURRENT_REQUESTS * 0.8)
+_INVALID_EMAIL_ID_THRESHOLD = math.ceil(len(_INVALID_EMAIL_IDS) * 0.8)
+
+# Category of every test, keyed by exact test name as recorded by the
+# category dispatchers, so failure summaries need no substring matching
+_TEST_CATEGORIES = {
+    **dict.fromkeys(
+        ("http_status_codes", "empty_responses", "rate_limiting", "timeout_handling", "request_methods"),
+        "API Client Functionality",
+    ),
+    **dict.fromkeys(
+        ("successful_email_sending", "multiple_recipients", "content_types", "importance_levels", "large_email_content"),
+        "Email Sending Scenarios",
+    ),
+    **dict.fromkeys(
+        ("invalid_email_addresses", "missing_required_fields", "special_characters", "email_validation_edge_cases"),
+        "Data Validation",
+    ),
+    **dict.fromkeys(
+        ("connection_timeout", "dns_failure", "ssl_errors", "intermittent_connectivity"),
+        "Network Resilience",
+    ),
+    **dict.fromkeys(
+        ("expired_token", "invalid_token", "token_refresh"),
+        "Authentication Scenarios",
+    ),
+    **dict.fromkeys(
+        ("list_emails_parameters", "email_search", "read_email", "invalid_email_ids"),
+        "Email Operations",
+    ),
+    **dict.fromkeys(
+        ("concurrent_requests", "unicode_content", "malformed_json", "api_version_compatibility"),
+        "Edge Cases",
+    ),
+    **dict.fromkeys(
+        ("response_times", "memory_usage", "resource_cleanup"),
+        "Performance Scenarios",
+    ),
+}
+
+# Test-name substrings (lowercase) that attribute a failure to an area, with
+# the recommendation made when any test in that area fails, in report order
+_RECOMMENDATION_AREAS = (
+    (("auth",), "🔐 Review authentication error handling and token management"),
+    (("network", "timeout"), "🌐 Implement retry logic and better network error handling"),
+    (("email", "send"), "📧 Review email sending logic and recipient validation"),
+    (("validation", "invalid"), "📊 Strengthen input validation and data sanitization"),
+    (("performance", "memory"), "⚡ Optimize performance and memory usage for large operations"),
+)
+
+
+@dataclass(slots=True, frozen=True)
 class TestResult:
     """Individual test result"""
     test_name: str
@@ -78,7 +239,7 @@ class TestResult:
     severity: str = "medium"  # low, medium, high, critical
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestSuiteReport:
     """Complete test suite report"""
     timestamp: str
@@ -92,53 +253,135 @@ class TestSuiteReport:
     recommendations: List[str]
 
 
+
+@dataclass(slots=True, frozen=True)
+class _FailureCase:
+    """A single list_emails call wired to fail, and how the suite judges the error"""
+    test_name: str
+    expected: type  # exception type the client should surface
+    missing_message: str  # recorded when no exception is raised
+    handled_message: str
+    raises: Optional[tuple] = None  # (exception class, text) raised by httpx.AsyncClient.get
+    response: Any = None  # returned by httpx.AsyncClient.get when raises is None
+    token: Optional[str] = None  # None uses the shared valid-token client
+    status_code: Optional[int] = None  # required GraphAPIError.status_code
+    # Error-text substrings accepted when the failure surfaces as a different exception type
+    error_tokens: tuple = ()
+    fallback_message: str = ""
+
+
+_NETWORK_FAILURE_CASES = (
+    _FailureCase(
+        "connection_timeout", httpx.ConnectTimeout,
+        "Should have raised timeout exception", "✅ Correctly handled connection timeout",
+        raises=(httpx.ConnectTimeout, "Connection timeout"),
+        error_tokens=("timeout",), fallback_message="✅ Handled timeout appropriately",
+    ),
+    _FailureCase(
+        "dns_failure", httpx.ConnectError,
+        "Should have raised connect error", "✅ Correctly handled DNS failure",
+        raises=(httpx.ConnectError, "DNS resolution failed"),
+        error_tokens=("dns", "connect"), fallback_message="✅ Handled DNS error appropriately",
+    ),
+    _FailureCase(
+        "ssl_errors", ssl.SSLError,
+        "Should have raised SSL error", "✅ Correctly handled SSL error",
+        raises=(ssl.SSLError, "SSL certificate verification failed"),
+        error_tokens=("ssl", "certificate"), fallback_message="✅ Handled SSL error appropriately",
+    ),
+)
+
+_AUTH_FAILURE_CASES = (
+    _FailureCase(
+        "expired_token", GraphAPIError,
+        "Should have raised GraphAPIError", "✅ Correctly handled expired token",
+        response=_UNAUTHORIZED_401, token="expired_token", status_code=401,
+    ),
+    _FailureCase(
+        "invalid_token", GraphAPIError,
+        "Should have raised GraphAPIError", "✅ Correctly handled invalid token",
+        response=_UNAUTHORIZED_401, token="invalid_token", status_code=401,
+    ),
+)
+
+
+def _tracked(test_name: str, severity: str = "medium", message_prefix: str = "Test setup failed"):
+    """Run a test method with its name and start time, recording a failed
+    result prefixed with message_prefix if the body raises before it records
+    one itself"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self):
+            start_ns = time.perf_counter_ns()
+            try:
+                return await func(self, test_name, start_ns)
+            except Exception as e:
+                self._record_test_result(test_name, False, f"{message_prefix}: {str(e)}", start_ns, severity=severity)
+        return wrapper
+    return decorator
+
+
 class MSGraphTestSuite:
     """Comprehensive test suite for Microsoft Graph API workflow"""
     
-    def __init__(self):
-        self.start_time = datetime.now()
+    def __init__(self, write_report: Optional[bool] = None):
+        # The JSON report file is opt-in: pass write_report or set MSGRAPH_WRITE_REPORT=1
+        if write_report is None:
+            write_report = os.environ.get("MSGRAPH_WRITE_REPORT", "").lower() in ("1", "true", "yes")
+        self.write_report = write_report
+        self._log = logger.info
+        # Token manager for tests that only need a valid token. Autospec walks
+        # MSGraphTokenManager once per suite instead of on every test, and keeps
+        # the double in sync with the real async get_access_token signature
+        self._token_manager = create_autospec(MSGraphTokenManager, instance=True)
+        self._token_manager.get_access_token.return_value = "valid_token"
+        # MSGraphClient holds no per-request state, so one instance backed by
+        # the valid-token manager serves every test that doesn't vary tokens
+        self._shared_client = MSGraphClient(self._token_manager)
+        self.reset()
+    
+    def reset(self):
+        """Clear recorded results and restart the run clock so the suite instance can be run again"""
+        # Monotonic start of the run; the report's timestamp comes from the wall clock
+        self._start_ns = time.perf_counter_ns()
+        # A new list rather than clear(), so a previous report keeps its results
         self.test_results: List[TestResult] = []
-        self.temp_dir = None
+        # Pass/fail/critical tallies kept as results are recorded
+        self._counters: Counter = Counter()
+        # Bound once per run; _record_test_result runs for every test
+        self._append_result = self.test_results.append
+        # Drop awaits recorded by earlier runs; the return value is kept
+        self._token_manager.reset_mock()
         
     async def run_all_tests(self) -> TestSuiteReport:
         """Run comprehensive test suite"""
+        self.reset()
         logger.info("🧪 Starting comprehensive Microsoft Graph API workflow test suite")
         logger.info("="*80)
         
-        # Setup temp directory for logs
-        self.temp_dir = tempfile.mkdtemp(prefix="msgraph_test_")
-        logger.info(f"📁 Created temporary directory: {self.temp_dir}")
+        # API Client Tests
+        await self._test_api_client_functionality()
         
-        try:
-            # API Client Tests
-            await self._test_api_client_functionality()
-            
-            # Email Sending Tests
-            await self._test_email_sending_scenarios()
-            
-            # Data Validation Tests
-            await self._test_data_validation()
-            
-            # Network Resilience Tests
-            await self._test_network_resilience()
-            
-            # Authentication Tests
-            await self._test_authentication_scenarios()
-            
-            # Email Operations Tests
-            await self._test_email_operations()
-            
-            # Edge Case Tests
-            await self._test_edge_cases()
-            
-            # Performance Tests
-            await self._test_performance_scenarios()
-            
-        finally:
-            # Cleanup temp directory
-            if self.temp_dir and os.path.exists(self.temp_dir):
-                shutil.rmtree(self.temp_dir)
-                logger.info(f"🧹 Cleaned up temporary directory")
+        # Email Sending Tests
+        await self._test_email_sending_scenarios()
+        
+        # Data Validation Tests
+        await self._test_data_validation()
+        
+        # Network Resilience Tests
+        await self._test_network_resilience()
+        
+        # Authentication Tests
+        await self._test_authentication_scenarios()
+        
+        # Email Operations Tests
+        await self._test_email_operations()
+        
+        # Edge Case Tests
+        await self._test_edge_cases()
+        
+        # Performance Tests
+        await self._test_performance_scenarios()
         
         return self._generate_report()
     
@@ -166,170 +409,111 @@ class MSGraphTestSuite:
         await self._test_request_methods()
     
     @expected_test_error
-    async def _test_http_status_codes(self):
+    @_tracked("http_status_codes")
+    async def _test_http_status_codes(self, test_name: str, start_ns: int):
         """Test various HTTP status code responses"""
-        start_time = datetime.now()
-        test_name = "http_status_codes"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
-            
-            client = MSGraphClient(mock_token_manager)
-            
-            # Test different status codes
-            status_codes = [400, 401, 403, 404, 429, 500, 502, 503]
-            handled_correctly = 0
-            
-            for status_code in status_codes:
-                with patch('httpx.AsyncClient') as mock_client:
-                    mock_response = Mock()
-                    mock_response.status_code = status_code
-                    mock_response.is_success = False
-                    mock_response.text = f"Error {status_code}"
-                    mock_response.reason_phrase = f"Status {status_code}"
-                    mock_response.json.return_value = {"error": {"message": f"Error {status_code}"}}
-                    
-                    mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-                    
-                    try:
-                        await client.list_emails(count=1)
-                    except GraphAPIError as e:
-                        if e.status_code == status_code:
-                            handled_correctly += 1
-                    except Exception:
-                        pass  # Other exceptions are also acceptable
-            
-            if handled_correctly >= len(status_codes) * 0.8:  # 80% success rate
-                self._record_test_result(test_name, True, f"✅ Handled {handled_correctly}/{len(status_codes)} status codes correctly", start_time)
-            else:
-                self._record_test_result(test_name, False, f"Only handled {handled_correctly}/{len(status_codes)} status codes", start_time, severity="medium")
+        # Test different status codes
+        handled_correctly = 0
+        
+        for status_code in _HTTP_ERROR_STATUS_CODES:
+            with patch('httpx.AsyncClient') as mock_client:
+                mock_response = FakeResponse(status_code=status_code, is_success=False, text=f"Error {status_code}", payload={"error": {"message": f"Error {status_code}"}})
                 
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+                mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+                
+                try:
+                    await client.list_emails(count=1)
+                except GraphAPIError as e:
+                    if e.status_code == status_code:
+                        handled_correctly += 1
+                except Exception:
+                    pass  # Other exceptions are also acceptable
+        
+        if handled_correctly >= _HTTP_ERROR_STATUS_THRESHOLD:
+            self._record_test_result(test_name, True, f"✅ Handled {handled_correctly}/{len(_HTTP_ERROR_STATUS_CODES)} status codes correctly", start_ns)
+        else:
+            self._record_test_result(test_name, False, f"Only handled {handled_correctly}/{len(_HTTP_ERROR_STATUS_CODES)} status codes", start_ns, severity="medium")
     
-    async def _test_empty_responses(self):
+    @_tracked("empty_responses")
+    async def _test_empty_responses(self, test_name: str, start_ns: int):
         """Test empty response handling"""
-        start_time = datetime.now()
-        test_name = "empty_responses"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = FakeResponse(status_code=200, is_success=True, text="")  # Empty response
             
-            client = MSGraphClient(mock_token_manager)
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
             
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 200
-                mock_response.is_success = True
-                mock_response.text = ""  # Empty response
-                
-                mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-                
-                try:
-                    result = await client.list_emails(count=1)
-                    # Should return empty dict or handle gracefully
-                    if isinstance(result, dict):
-                        self._record_test_result(test_name, True, "✅ Handled empty response gracefully", start_time)
-                    else:
-                        self._record_test_result(test_name, False, f"Unexpected result type: {type(result)}", start_time, severity="medium")
-                except Exception as e:
-                    self._record_test_result(test_name, False, f"Failed to handle empty response: {str(e)}", start_time, severity="medium")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+            try:
+                result = await client.list_emails(count=1)
+                # Should return empty dict or handle gracefully
+                if isinstance(result, dict):
+                    self._record_test_result(test_name, True, "✅ Handled empty response gracefully", start_ns)
+                else:
+                    self._record_test_result(test_name, False, f"Unexpected result type: {type(result)}", start_ns, severity="medium")
+            except Exception as e:
+                self._record_test_result(test_name, False, f"Failed to handle empty response: {str(e)}", start_ns, severity="medium")
     
     @expected_test_error
-    async def _test_rate_limiting(self):
+    @_tracked("rate_limiting")
+    async def _test_rate_limiting(self, test_name: str, start_ns: int):
         """Test rate limiting response handling"""
-        start_time = datetime.now()
-        test_name = "rate_limiting"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = FakeResponse(status_code=429, is_success=False, text="Rate limit exceeded", payload={"error": {"message": "Rate limit exceeded"}})
             
-            client = MSGraphClient(mock_token_manager)
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
             
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 429
-                mock_response.is_success = False
-                mock_response.text = "Rate limit exceeded"
-                mock_response.reason_phrase = "Too Many Requests"
-                mock_response.json.return_value = {"error": {"message": "Rate limit exceeded"}}
-                
-                mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-                
-                try:
-                    await client.list_emails(count=1)
-                    self._record_test_result(test_name, False, "Should have raised GraphAPIError", start_time, severity="medium")
-                except GraphAPIError as e:
-                    if e.status_code == 429:
-                        self._record_test_result(test_name, True, "✅ Correctly handled rate limiting", start_time)
-                    else:
-                        self._record_test_result(test_name, False, f"Wrong status code: {e.status_code}", start_time, severity="medium")
-                except Exception as e:
-                    self._record_test_result(test_name, False, f"Unexpected error: {str(e)}", start_time, severity="medium")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+            try:
+                await client.list_emails(count=1)
+                self._record_test_result(test_name, False, "Should have raised GraphAPIError", start_ns, severity="medium")
+            except GraphAPIError as e:
+                if e.status_code == 429:
+                    self._record_test_result(test_name, True, "✅ Correctly handled rate limiting", start_ns)
+                else:
+                    self._record_test_result(test_name, False, f"Wrong status code: {e.status_code}", start_ns, severity="medium")
+            except Exception as e:
+                self._record_test_result(test_name, False, f"Unexpected error: {str(e)}", start_ns, severity="medium")
     
     @expected_test_error
-    async def _test_timeout_handling(self):
+    @_tracked("timeout_handling")
+    async def _test_timeout_handling(self, test_name: str, start_ns: int):
         """Test timeout handling"""
-        start_time = datetime.now()
-        test_name = "timeout_handling"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
-            
-            client = MSGraphClient(mock_token_manager)
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(side_effect=httpx.TimeoutException("Request timeout"))
             
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_client.return_value.__aenter__.return_value.get.side_effect = httpx.TimeoutException("Request timeout")
-                
-                try:
-                    await client.list_emails(count=1)
-                    self._record_test_result(test_name, False, "Should have raised timeout exception", start_time, severity="medium")
-                except httpx.TimeoutException:
-                    self._record_test_result(test_name, True, "✅ Correctly handled timeout", start_time)
-                except Exception as e:
-                    if "timeout" in str(e).lower():
-                        self._record_test_result(test_name, True, "✅ Handled timeout error", start_time)
-                    else:
-                        self._record_test_result(test_name, False, f"Unexpected error: {str(e)}", start_time, severity="medium")
-                        
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+            try:
+                await client.list_emails(count=1)
+                self._record_test_result(test_name, False, "Should have raised timeout exception", start_ns, severity="medium")
+            except httpx.TimeoutException:
+                self._record_test_result(test_name, True, "✅ Correctly handled timeout", start_ns)
+            except Exception as e:
+                if "timeout" in str(e).lower():
+                    self._record_test_result(test_name, True, "✅ Handled timeout error", start_ns)
+                else:
+                    self._record_test_result(test_name, False, f"Unexpected error: {str(e)}", start_ns, severity="medium")
     
-    async def _test_request_methods(self):
+    @_tracked("request_methods")
+    async def _test_request_methods(self, test_name: str, start_ns: int):
         """Test unsupported HTTP method handling"""
-        start_time = datetime.now()
-        test_name = "request_methods"
+        client = self._shared_client
         
         try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
-            
-            client = MSGraphClient(mock_token_manager)
-            
-            try:
-                # Test unsupported method
-                await client._make_request('PUT', 'me/messages')
-                self._record_test_result(test_name, False, "Should have raised ValueError for unsupported method", start_time, severity="medium")
-            except ValueError as e:
-                if "unsupported" in str(e).lower():
-                    self._record_test_result(test_name, True, "✅ Correctly rejected unsupported HTTP method", start_time)
-                else:
-                    self._record_test_result(test_name, False, f"Wrong error message: {str(e)}", start_time, severity="medium")
-            except Exception as e:
-                self._record_test_result(test_name, False, f"Unexpected error: {str(e)}", start_time, severity="medium")
-                
+            # Test unsupported method
+            await client._make_request('PUT', 'me/messages')
+            self._record_test_result(test_name, False, "Should have raised ValueError for unsupported method", start_ns, severity="medium")
+        except ValueError as e:
+            if "unsupported" in str(e).lower():
+                self._record_test_result(test_name, True, "✅ Correctly rejected unsupported HTTP method", start_ns)
+            else:
+                self._record_test_result(test_name, False, f"Wrong error message: {str(e)}", start_ns, severity="medium")
         except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+            self._record_test_result(test_name, False, f"Unexpected error: {str(e)}", start_ns, severity="medium")
     
     # =============================================================================
     # Email Sending Tests
@@ -354,219 +538,154 @@ class MSGraphTestSuite:
         # Test 2.5: Large email content
         await self._test_large_email_content()
     
-    async def _test_successful_email_sending(self):
+    @_tracked("successful_email_sending")
+    async def _test_successful_email_sending(self, test_name: str, start_ns: int):
         """Test successful email sending"""
-        start_time = datetime.now()
-        test_name = "successful_email_sending"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = _ACCEPTED_202
             
-            client = MSGraphClient(mock_token_manager)
+            mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
             
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 202
-                mock_response.is_success = True
-                mock_response.text = ""
+            # Mock EmailValidator
+            with patch('clients.graph_api_client.EmailValidator') as mock_validator:
+                mock_validator.format_recipients.return_value = [{"emailAddress": {"address": "test@example.com", "name": "Test User"}}]
                 
-                mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+                result = await client.send_email(
+                    to="test@example.com",
+                    subject="Test Email",
+                    body="This is a test email"
+                )
                 
-                # Mock EmailValidator
-                with patch('clients.graph_api_client.EmailValidator') as mock_validator:
-                    mock_validator.format_recipients.return_value = [{"emailAddress": {"address": "test@example.com", "name": "Test User"}}]
-                    
-                    result = await client.send_email(
-                        to="test@example.com",
-                        subject="Test Email",
-                        body="This is a test email"
-                    )
-                    
-                    if result.success:
-                        self._record_test_result(test_name, True, "✅ Successfully sent email", start_time)
-                    else:
-                        self._record_test_result(test_name, False, f"Email sending failed: {result.error}", start_time, severity="medium")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+                if result.success:
+                    self._record_test_result(test_name, True, "✅ Successfully sent email", start_ns)
+                else:
+                    self._record_test_result(test_name, False, f"Email sending failed: {result.error}", start_ns, severity="medium")
     
-    async def _test_multiple_recipients(self):
+    @_tracked("multiple_recipients")
+    async def _test_multiple_recipients(self, test_name: str, start_ns: int):
         """Test multiple recipients handling"""
-        start_time = datetime.now()
-        test_name = "multiple_recipients"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = _ACCEPTED_202
             
-            client = MSGraphClient(mock_token_manager)
+            mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
             
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 202
-                mock_response.is_success = True
-                mock_response.text = ""
+            # Mock EmailValidator for multiple recipients
+            with patch('clients.graph_api_client.EmailValidator') as mock_validator:
+                mock_validator.format_recipients.side_effect = [
+                    [{"emailAddress": {"address": "test1@example.com", "name": "Test User 1"}}, 
+                     {"emailAddress": {"address": "test2@example.com", "name": "Test User 2"}}],
+                    [{"emailAddress": {"address": "cc@example.com", "name": "CC User"}}],
+                    [{"emailAddress": {"address": "bcc@example.com", "name": "BCC User"}}]
+                ]
                 
-                mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+                result = await client.send_email(
+                    to="test1@example.com,test2@example.com",
+                    subject="Test Multiple Recipients",
+                    body="This is a test email",
+                    cc="cc@example.com",
+                    bcc="bcc@example.com"
+                )
                 
-                # Mock EmailValidator for multiple recipients
-                with patch('clients.graph_api_client.EmailValidator') as mock_validator:
-                    mock_validator.format_recipients.side_effect = [
-                        [{"emailAddress": {"address": "test1@example.com", "name": "Test User 1"}}, 
-                         {"emailAddress": {"address": "test2@example.com", "name": "Test User 2"}}],
-                        [{"emailAddress": {"address": "cc@example.com", "name": "CC User"}}],
-                        [{"emailAddress": {"address": "bcc@example.com", "name": "BCC User"}}]
-                    ]
-                    
-                    result = await client.send_email(
-                        to="test1@example.com,test2@example.com",
-                        subject="Test Multiple Recipients",
-                        body="This is a test email",
-                        cc="cc@example.com",
-                        bcc="bcc@example.com"
-                    )
-                    
-                    if result.success:
-                        self._record_test_result(test_name, True, "✅ Successfully handled multiple recipients", start_time)
-                    else:
-                        self._record_test_result(test_name, False, f"Multiple recipients failed: {result.error}", start_time, severity="medium")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+                if result.success:
+                    self._record_test_result(test_name, True, "✅ Successfully handled multiple recipients", start_ns)
+                else:
+                    self._record_test_result(test_name, False, f"Multiple recipients failed: {result.error}", start_ns, severity="medium")
     
-    async def _test_content_types(self):
+    @_tracked("content_types")
+    async def _test_content_types(self, test_name: str, start_ns: int):
         """Test HTML vs text content detection"""
-        start_time = datetime.now()
-        test_name = "content_types"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = _ACCEPTED_202
             
-            client = MSGraphClient(mock_token_manager)
+            mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
             
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 202
-                mock_response.is_success = True
-                mock_response.text = ""
+            with patch('clients.graph_api_client.EmailValidator') as mock_validator:
+                mock_validator.format_recipients.return_value = [{"emailAddress": {"address": "test@example.com", "name": "Test User"}}]
                 
-                mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+                # Test HTML content
+                html_result = await client.send_email(
+                    to="test@example.com",
+                    subject="HTML Test",
+                    body="<html><body><h1>This is HTML</h1></body></html>"
+                )
                 
-                with patch('clients.graph_api_client.EmailValidator') as mock_validator:
-                    mock_validator.format_recipients.return_value = [{"emailAddress": {"address": "test@example.com", "name": "Test User"}}]
-                    
-                    # Test HTML content
-                    html_result = await client.send_email(
-                        to="test@example.com",
-                        subject="HTML Test",
-                        body="<html><body><h1>This is HTML</h1></body></html>"
-                    )
-                    
-                    # Test plain text content
-                    text_result = await client.send_email(
-                        to="test@example.com",
-                        subject="Text Test",
-                        body="This is plain text"
-                    )
-                    
-                    if html_result.success and text_result.success:
-                        self._record_test_result(test_name, True, "✅ Successfully handled both HTML and text content", start_time)
-                    else:
-                        errors = []
-                        if not html_result.success:
-                            errors.append(f"HTML: {html_result.error}")
-                        if not text_result.success:
-                            errors.append(f"Text: {text_result.error}")
-                        self._record_test_result(test_name, False, f"Content type issues: {'; '.join(errors)}", start_time, severity="medium")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+                # Test plain text content
+                text_result = await client.send_email(
+                    to="test@example.com",
+                    subject="Text Test",
+                    body="This is plain text"
+                )
+                
+                if html_result.success and text_result.success:
+                    self._record_test_result(test_name, True, "✅ Successfully handled both HTML and text content", start_ns)
+                else:
+                    errors = []
+                    if not html_result.success:
+                        errors.append(f"HTML: {html_result.error}")
+                    if not text_result.success:
+                        errors.append(f"Text: {text_result.error}")
+                    self._record_test_result(test_name, False, f"Content type issues: {'; '.join(errors)}", start_ns, severity="medium")
     
-    async def _test_importance_levels(self):
+    @_tracked("importance_levels")
+    async def _test_importance_levels(self, test_name: str, start_ns: int):
         """Test email importance levels"""
-        start_time = datetime.now()
-        test_name = "importance_levels"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = _ACCEPTED_202
             
-            client = MSGraphClient(mock_token_manager)
+            mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
             
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 202
-                mock_response.is_success = True
-                mock_response.text = ""
+            with patch('clients.graph_api_client.EmailValidator') as mock_validator:
+                mock_validator.format_recipients.return_value = [{"emailAddress": {"address": "test@example.com", "name": "Test User"}}]
                 
-                mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+                successful_levels = 0
                 
-                with patch('clients.graph_api_client.EmailValidator') as mock_validator:
-                    mock_validator.format_recipients.return_value = [{"emailAddress": {"address": "test@example.com", "name": "Test User"}}]
-                    
-                    importance_levels = [EmailImportance.LOW, EmailImportance.NORMAL, EmailImportance.HIGH]
-                    successful_levels = 0
-                    
-                    for importance in importance_levels:
-                        result = await client.send_email(
-                            to="test@example.com",
-                            subject=f"Importance Test - {importance.value}",
-                            body="Test importance level",
-                            importance=importance
-                        )
-                        
-                        if result.success:
-                            successful_levels += 1
-                    
-                    if successful_levels == len(importance_levels):
-                        self._record_test_result(test_name, True, "✅ Successfully handled all importance levels", start_time)
-                    else:
-                        self._record_test_result(test_name, False, f"Only {successful_levels}/{len(importance_levels)} importance levels worked", start_time, severity="medium")
+                for importance in _IMPORTANCE_LEVELS:
+                    result = await client.send_email(
+                        to="test@example.com",
+                        subject=f"Importance Test - {importance.value}",
+                        body="Test importance level",
+                        importance=importance
+                    )
                     
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+                    if result.success:
+                        successful_levels += 1
+                
+                if successful_levels == len(_IMPORTANCE_LEVELS):
+                    self._record_test_result(test_name, True, "✅ Successfully handled all importance levels", start_ns)
+                else:
+                    self._record_test_result(test_name, False, f"Only {successful_levels}/{len(_IMPORTANCE_LEVELS)} importance levels worked", start_ns, severity="medium")
     
-    async def _test_large_email_content(self):
+    @_tracked("large_email_content")
+    async def _test_large_email_content(self, test_name: str, start_ns: int):
         """Test large email content handling"""
-        start_time = datetime.now()
-        test_name = "large_email_content"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = FakeResponse(status_code=413, is_success=False, text="Request entity too large", payload={"error": {"message": "Request entity too large"}})
             
-            client = MSGraphClient(mock_token_manager)
+            mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
             
-            # Create large email content (1MB)
-            large_content = "A" * (1024 * 1024)
-            
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 413  # Request Entity Too Large
-                mock_response.is_success = False
-                mock_response.text = "Request entity too large"
-                mock_response.json.return_value = {"error": {"message": "Request entity too large"}}
+            with patch('clients.graph_api_client.EmailValidator') as mock_validator:
+                mock_validator.format_recipients.return_value = [{"emailAddress": {"address": "test@example.com", "name": "Test User"}}]
                 
-                mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+                result = await client.send_email(
+                    to="test@example.com",
+                    subject="Large Content Test",
+                    body=_LARGE_BODY
+                )
                 
-                with patch('clients.graph_api_client.EmailValidator') as mock_validator:
-                    mock_validator.format_recipients.return_value = [{"emailAddress": {"address": "test@example.com", "name": "Test User"}}]
-                    
-                    result = await client.send_email(
-                        to="test@example.com",
-                        subject="Large Content Test",
-                        body=large_content
-                    )
-                    
-                    if not result.success and "413" in str(result.error):
-                        self._record_test_result(test_name, True, "✅ Correctly handled large content rejection", start_time)
-                    else:
-                        self._record_test_result(test_name, False, f"Unexpected result: {result.error}", start_time, severity="medium")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+                if not result.success and "413" in str(result.error):
+                    self._record_test_result(test_name, True, "✅ Correctly handled large content rejection", start_ns)
+                else:
+                    self._record_test_result(test_name, False, f"Unexpected result: {result.error}", start_ns, severity="medium")
     
     # =============================================================================
     # Data Validation Tests
@@ -589,71 +708,52 @@ class MSGraphTestSuite:
         await self._test_email_validation_edge_cases()
     
     @expected_test_error
-    async def _test_invalid_email_addresses(self):
+    @_tracked("invalid_email_addresses")
+    async def _test_invalid_email_addresses(self, test_name: str, start_ns: int):
         """Test invalid email address handling"""
-        start_time = datetime.now()
-        test_name = "invalid_email_addresses"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
-            
-            client = MSGraphClient(mock_token_manager)
-            
-            invalid_emails = [
-                "",
-                "invalid-email",
-                "@example.com",
-                "user@",
-                "user..user@example.com",
-                "user@example..com",
-                None
-            ]
-            
-            handled_correctly = 0
-            
-            for invalid_email in invalid_emails:
-                with patch('clients.graph_api_client.EmailValidator') as mock_validator:
-                    mock_validator.format_recipients.side_effect = ValueError(f"Invalid email: {invalid_email}")
-                    
-                    try:
-                        result = await client.send_email(
-                            to=invalid_email or "",
-                            subject="Test",
-                            body="Test"
-                        )
-                        
-                        if not result.success and "validation" in str(result.error).lower():
-                            handled_correctly += 1
-                    except Exception:
-                        handled_correctly += 1  # Exception is also valid handling
-            
-            if handled_correctly >= len(invalid_emails) * 0.8:  # 80% success rate
-                self._record_test_result(test_name, True, f"✅ Handled {handled_correctly}/{len(invalid_emails)} invalid emails correctly", start_time)
-            else:
-                self._record_test_result(test_name, False, f"Only handled {handled_correctly}/{len(invalid_emails)} invalid emails", start_time, severity="medium")
+        handled_correctly = 0
+        
+        for invalid_email in _INVALID_EMAILS:
+            with patch('clients.graph_api_client.EmailValidator') as mock_validator:
+                mock_validator.format_recipients.side_effect = ValueError(f"Invalid email: {invalid_email}")
                 
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+                try:
+                    result = await client.send_email(
+                        to=invalid_email or "",
+                        subject="Test",
+                        body="Test"
+                    )
+                    
+                    if not result.success and "validation" in str(result.error).lower():
+                        handled_correctly += 1
+                except Exception:
+                    handled_correctly += 1  # Exception is also valid handling
+        
+        if handled_correctly >= _INVALID_EMAILS_THRESHOLD:
+            self._record_test_result(test_name, True, f"✅ Handled {handled_correctly}/{len(_INVALID_EMAILS)} invalid emails correctly", start_ns)
+        else:
+            self._record_test_result(test_name, False, f"Only handled {handled_correctly}/{len(_INVALID_EMAILS)} invalid emails", start_ns, severity="medium")
     
-    async def _test_missing_required_fields(self):
+    @_tracked("missing_required_fields")
+    async def _test_missing_required_fields(self, test_name: str, start_ns: int):
         """Test missing required fields handling"""
-        start_time = datetime.now()
-        test_name = "missing_required_fields"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
-            
-            client = MSGraphClient(mock_token_manager)
-            
-            test_cases = [
-                {"to": "", "subject": "Test", "body": "Test"},  # Empty to
-                {"to": "test@example.com", "subject": "", "body": "Test"},  # Empty subject
-                {"to": "test@example.com", "subject": "Test", "body": ""},  # Empty body
-            ]
+        test_cases = [
+            {"to": "", "subject": "Test", "body": "Test"},  # Empty to
+            {"to": "test@example.com", "subject": "", "body": "Test"},  # Empty subject
+            {"to": "test@example.com", "subject": "Test", "body": ""},  # Empty body
+        ]
+        
+        handled_correctly = 0
+        
+        # Keep the send offline; only the client's handling of the fields matters
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = _ACCEPTED_202
             
-            handled_correctly = 0
+            mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
             
             for test_case in test_cases:
                 with patch('clients.graph_api_client.EmailValidator') as mock_validator:
@@ -667,103 +767,70 @@ class MSGraphTestSuite:
                     # Should handle empty required fields gracefully
                     if isinstance(result, SendEmailResponse):
                         handled_correctly += 1
-            
-            if handled_correctly == len(test_cases):
-                self._record_test_result(test_name, True, "✅ Handled missing required fields gracefully", start_time)
-            else:
-                self._record_test_result(test_name, False, f"Only handled {handled_correctly}/{len(test_cases)} missing field cases", start_time, severity="medium")
-                
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+        
+        if handled_correctly == len(test_cases):
+            self._record_test_result(test_name, True, "✅ Handled missing required fields gracefully", start_ns)
+        else:
+            self._record_test_result(test_name, False, f"Only handled {handled_correctly}/{len(test_cases)} missing field cases", start_ns, severity="medium")
     
-    async def _test_special_characters(self):
+    @_tracked("special_characters")
+    async def _test_special_characters(self, test_name: str, start_ns: int):
         """Test special characters in email content"""
-        start_time = datetime.now()
-        test_name = "special_characters"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
-            
-            client = MSGraphClient(mock_token_manager)
+        special_content = {
+            "subject": "Test with Special Chars: éñ中文🎯<>\"'&",
+            "body": "Content with unicode: ∑∆∏∂∫√≈≠≤≥ and HTML: <script>alert('test')</script>"
+        }
+        
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = _ACCEPTED_202
             
-            special_content = {
-                "subject": "Test with Special Chars: éñ中文🎯<>\"'&",
-                "body": "Content with unicode: ∑∆∏∂∫√≈≠≤≥ and HTML: <script>alert('test')</script>"
-            }
+            mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
             
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 202
-                mock_response.is_success = True
-                mock_response.text = ""
+            with patch('clients.graph_api_client.EmailValidator') as mock_validator:
+                mock_validator.format_recipients.return_value = [{"emailAddress": {"address": "test@example.com", "name": "Test User"}}]
                 
-                mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+                result = await client.send_email(
+                    to="test@example.com",
+                    **special_content
+                )
                 
-                with patch('clients.graph_api_client.EmailValidator') as mock_validator:
-                    mock_validator.format_recipients.return_value = [{"emailAddress": {"address": "test@example.com", "name": "Test User"}}]
-                    
-                    result = await client.send_email(
-                        to="test@example.com",
-                        **special_content
-                    )
-                    
-                    if result.success:
-                        self._record_test_result(test_name, True, "✅ Handled special characters in email content", start_time)
-                    else:
-                        self._record_test_result(test_name, False, f"Failed to handle special characters: {result.error}", start_time, severity="medium")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+                if result.success:
+                    self._record_test_result(test_name, True, "✅ Handled special characters in email content", start_ns)
+                else:
+                    self._record_test_result(test_name, False, f"Failed to handle special characters: {result.error}", start_ns, severity="medium")
     
-    async def _test_email_validation_edge_cases(self):
+    @_tracked("email_validation_edge_cases")
+    async def _test_email_validation_edge_cases(self, test_name: str, start_ns: int):
         """Test email validation edge cases"""
-        start_time = datetime.now()
-        test_name = "email_validation_edge_cases"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
-            
-            client = MSGraphClient(mock_token_manager)
-            
-            edge_cases = [
-                "test+tag@example.com",  # Plus addressing
-                "test.dot@example.com",  # Dot in local part
-                "test@sub.example.com",  # Subdomain
-                "very.long.email.address.with.many.dots@very.long.domain.name.com",  # Long email
-            ]
+        handled_correctly = 0
+        
+        # Patch once for all cases; only the validator's output changes per email
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = _ACCEPTED_202
             
-            handled_correctly = 0
+            mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
             
-            for email in edge_cases:
-                with patch('clients.graph_api_client.EmailValidator') as mock_validator:
+            with patch('clients.graph_api_client.EmailValidator') as mock_validator:
+                for email in _EDGE_CASE_EMAILS:
                     mock_validator.format_recipients.return_value = [{"emailAddress": {"address": email, "name": "Test"}}]
                     
-                    with patch('httpx.AsyncClient') as mock_client:
-                        mock_response = Mock()
-                        mock_response.status_code = 202
-                        mock_response.is_success = True
-                        mock_response.text = ""
-                        
-                        mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
-                        
-                        result = await client.send_email(
-                            to=email,
-                            subject="Edge Case Test",
-                            body="Test"
-                        )
-                        
-                        if result.success:
-                            handled_correctly += 1
-            
-            if handled_correctly >= len(edge_cases) * 0.8:  # 80% success rate
-                self._record_test_result(test_name, True, f"✅ Handled {handled_correctly}/{len(edge_cases)} email edge cases", start_time)
-            else:
-                self._record_test_result(test_name, False, f"Only handled {handled_correctly}/{len(edge_cases)} email edge cases", start_time, severity="medium")
-                
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+                    result = await client.send_email(
+                        to=email,
+                        subject="Edge Case Test",
+                        body="Test"
+                    )
+                    
+                    if result.success:
+                        handled_correctly += 1
+        
+        if handled_correctly >= _EDGE_CASE_THRESHOLD:
+            self._record_test_result(test_name, True, f"✅ Handled {handled_correctly}/{len(_EDGE_CASE_EMAILS)} email edge cases", start_ns)
+        else:
+            self._record_test_result(test_name, False, f"Only handled {handled_correctly}/{len(_EDGE_CASE_EMAILS)} email edge cases", start_ns, severity="medium")
     
     # =============================================================================
     # Network Resilience Tests  
@@ -773,152 +840,80 @@ class MSGraphTestSuite:
         """Test 4: Network resilience scenarios"""
         logger.info("🌐 Test Category 4: Network Resilience")
         
-        # Test 4.1: Connection timeout
-        await self._test_connection_timeout()
-        
-        # Test 4.2: DNS resolution failure
-        await self._test_dns_failure()
-        
-        # Test 4.3: SSL/TLS errors
-        await self._test_ssl_errors()
+        # Test 4.1-4.3: Connection timeout, DNS resolution failure, SSL/TLS errors
+        for case in _NETWORK_FAILURE_CASES:
+            await self._run_failure_case(case)
         
         # Test 4.4: Intermittent connectivity
         await self._test_intermittent_connectivity()
     
-    async def _test_connection_timeout(self):
-        """Test connection timeout handling"""
-        start_time = datetime.now()
-        test_name = "connection_timeout"
+    async def _run_failure_case(self, case: _FailureCase):
+        """Run one table-driven failure scenario from _NETWORK/_AUTH_FAILURE_CASES"""
+        start_ns = time.perf_counter_ns()
+        test_name = case.test_name
         
         try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
-            
-            client = MSGraphClient(mock_token_manager)
+            if case.token is None:
+                client = self._shared_client
+            else:
+                mock_token_manager = Mock(spec=MSGraphTokenManager)
+                mock_token_manager.get_access_token.return_value = case.token
+                client = MSGraphClient(mock_token_manager)
             
             with patch('httpx.AsyncClient') as mock_client:
-                mock_client.return_value.__aenter__.return_value.get.side_effect = httpx.ConnectTimeout("Connection timeout")
+                if case.raises is not None:
+                    error_class, error_text = case.raises
+                    mock_get = AsyncMock(side_effect=error_class(error_text))
+                else:
+                    mock_get = AsyncMock(return_value=case.response)
+                mock_client.return_value.__aenter__.return_value.get = mock_get
                 
                 try:
                     await client.list_emails(count=1)
-                    self._record_test_result(test_name, False, "Should have raised timeout exception", start_time, severity="medium")
-                except httpx.ConnectTimeout:
-                    self._record_test_result(test_name, True, "✅ Correctly handled connection timeout", start_time)
-                except Exception as e:
-                    if "timeout" in str(e).lower():
-                        self._record_test_result(test_name, True, "✅ Handled timeout appropriately", start_time)
+                    self._record_test_result(test_name, False, case.missing_message, start_ns, severity="medium")
+                except case.expected as e:
+                    if case.status_code is None or e.status_code == case.status_code:
+                        self._record_test_result(test_name, True, case.handled_message, start_ns)
                     else:
-                        self._record_test_result(test_name, False, f"Unexpected error: {str(e)}", start_time, severity="medium")
-                        
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
-    
-    async def _test_dns_failure(self):
-        """Test DNS resolution failure"""
-        start_time = datetime.now()
-        test_name = "dns_failure"
-        
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
-            
-            client = MSGraphClient(mock_token_manager)
-            
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_client.return_value.__aenter__.return_value.get.side_effect = httpx.ConnectError("DNS resolution failed")
-                
-                try:
-                    await client.list_emails(count=1)
-                    self._record_test_result(test_name, False, "Should have raised connect error", start_time, severity="medium")
-                except httpx.ConnectError:
-                    self._record_test_result(test_name, True, "✅ Correctly handled DNS failure", start_time)
+                        self._record_test_result(test_name, False, f"Wrong status code: {e.status_code}", start_ns, severity="medium")
                 except Exception as e:
-                    if "dns" in str(e).lower() or "connect" in str(e).lower():
-                        self._record_test_result(test_name, True, "✅ Handled DNS error appropriately", start_time)
+                    error_message = str(e).lower()
+                    if any(token in error_message for token in case.error_tokens):
+                        self._record_test_result(test_name, True, case.fallback_message, start_ns)
                     else:
-                        self._record_test_result(test_name, False, f"Unexpected error: {str(e)}", start_time, severity="medium")
+                        self._record_test_result(test_name, False, f"Unexpected error: {str(e)}", start_ns, severity="medium")
                         
         except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_ns, severity="medium")
     
-    async def _test_ssl_errors(self):
-        """Test SSL/TLS error handling"""
-        start_time = datetime.now()
-        test_name = "ssl_errors"
+    @_tracked("intermittent_connectivity")
+    async def _test_intermittent_connectivity(self, test_name: str, start_ns: int):
+        """Test intermittent connectivity handling"""
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
+        # Simulate intermittent failures: fail on odd calls, succeed on even calls
+        intermittent_failure = itertools.cycle((httpx.NetworkError("Network unreachable"), _OK_EMPTY_LIST))
+        
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(side_effect=intermittent_failure)
             
-            client = MSGraphClient(mock_token_manager)
+            success_count = 0
+            failure_count = 0
             
-            import ssl
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_client.return_value.__aenter__.return_value.get.side_effect = ssl.SSLError("SSL certificate verification failed")
-                
+            # Try 4 calls to test intermittent behavior
+            for i in range(4):
                 try:
                     await client.list_emails(count=1)
-                    self._record_test_result(test_name, False, "Should have raised SSL error", start_time, severity="medium")
-                except ssl.SSLError:
-                    self._record_test_result(test_name, True, "✅ Correctly handled SSL error", start_time)
-                except Exception as e:
-                    if "ssl" in str(e).lower() or "certificate" in str(e).lower():
-                        self._record_test_result(test_name, True, "✅ Handled SSL error appropriately", start_time)
-                    else:
-                        self._record_test_result(test_name, False, f"Unexpected error: {str(e)}", start_time, severity="medium")
-                        
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
-    
-    async def _test_intermittent_connectivity(self):
-        """Test intermittent connectivity handling"""
-        start_time = datetime.now()
-        test_name = "intermittent_connectivity"
-        
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
-            
-            client = MSGraphClient(mock_token_manager)
-            
-            # Simulate intermittent failures
-            call_count = 0
-            def intermittent_failure(*args, **kwargs):
-                nonlocal call_count
-                call_count += 1
-                if call_count % 2 == 1:  # Fail on odd calls
-                    raise httpx.NetworkError("Network unreachable")
-                else:  # Succeed on even calls
-                    mock_response = Mock()
-                    mock_response.status_code = 200
-                    mock_response.is_success = True
-                    mock_response.text = '{"value": []}'
-                    mock_response.json.return_value = {"value": []}
-                    return mock_response
-            
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_client.return_value.__aenter__.return_value.get.side_effect = intermittent_failure
-                
-                success_count = 0
-                failure_count = 0
-                
-                # Try 4 calls to test intermittent behavior
-                for i in range(4):
-                    try:
-                        await client.list_emails(count=1)
-                        success_count += 1
-                    except httpx.NetworkError:
-                        failure_count += 1
-                    except Exception:
-                        pass
-                
-                if success_count > 0 and failure_count > 0:
-                    self._record_test_result(test_name, True, f"✅ Handled intermittent connectivity ({success_count} success, {failure_count} failures)", start_time)
-                else:
-                    self._record_test_result(test_name, False, f"Pattern not detected ({success_count} success, {failure_count} failures)", start_time, severity="low")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+                    success_count += 1
+                except httpx.NetworkError:
+                    failure_count += 1
+                except Exception:
+                    pass
+            
+            if success_count > 0 and failure_count > 0:
+                self._record_test_result(test_name, True, f"✅ Handled intermittent connectivity ({success_count} success, {failure_count} failures)", start_ns)
+            else:
+                self._record_test_result(test_name, False, f"Pattern not detected ({success_count} success, {failure_count} failures)", start_ns, severity="low")
     
     # =============================================================================
     # Authentication Tests
@@ -928,122 +923,36 @@ class MSGraphTestSuite:
         """Test 5: Authentication scenarios"""
         logger.info("🔐 Test Category 5: Authentication Scenarios")
         
-        # Test 5.1: Expired token handling
-        await self._test_expired_token()
-        
-        # Test 5.2: Invalid token handling
-        await self._test_invalid_token()
+        # Test 5.1-5.2: Expired and invalid token handling
+        for case in _AUTH_FAILURE_CASES:
+            await self._run_failure_case(case)
         
         # Test 5.3: Token refresh scenarios
         await self._test_token_refresh()
     
-    async def _test_expired_token(self):
-        """Test expired token handling"""
-        start_time = datetime.now()
-        test_name = "expired_token"
-        
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "expired_token"
-            
-            client = MSGraphClient(mock_token_manager)
-            
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 401
-                mock_response.is_success = False
-                mock_response.text = "Token expired"
-                mock_response.json.return_value = {"error": {"message": "Token has expired"}}
-                
-                mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-                
-                try:
-                    await client.list_emails(count=1)
-                    self._record_test_result(test_name, False, "Should have raised GraphAPIError", start_time, severity="medium")
-                except GraphAPIError as e:
-                    if e.status_code == 401:
-                        self._record_test_result(test_name, True, "✅ Correctly handled expired token", start_time)
-                    else:
-                        self._record_test_result(test_name, False, f"Wrong status code: {e.status_code}", start_time, severity="medium")
-                except Exception as e:
-                    self._record_test_result(test_name, False, f"Unexpected error: {str(e)}", start_time, severity="medium")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
-    
-    async def _test_invalid_token(self):
-        """Test invalid token handling"""
-        start_time = datetime.now()
-        test_name = "invalid_token"
-        
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "invalid_token"
-            
-            client = MSGraphClient(mock_token_manager)
-            
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 401
-                mock_response.is_success = False
-                mock_response.text = "Invalid token"
-                mock_response.json.return_value = {"error": {"message": "Invalid authentication token"}}
-                
-                mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-                
-                try:
-                    await client.list_emails(count=1)
-                    self._record_test_result(test_name, False, "Should have raised GraphAPIError", start_time, severity="medium")
-                except GraphAPIError as e:
-                    if e.status_code == 401:
-                        self._record_test_result(test_name, True, "✅ Correctly handled invalid token", start_time)
-                    else:
-                        self._record_test_result(test_name, False, f"Wrong status code: {e.status_code}", start_time, severity="medium")
-                except Exception as e:
-                    self._record_test_result(test_name, False, f"Unexpected error: {str(e)}", start_time, severity="medium")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
-    
-    async def _test_token_refresh(self):
+    @_tracked("token_refresh")
+    async def _test_token_refresh(self, test_name: str, start_ns: int):
         """Test token refresh scenarios"""
-        start_time = datetime.now()
-        test_name = "token_refresh"
+        mock_token_manager = Mock(spec=MSGraphTokenManager)
+        # Simulate token manager that refreshes token
+        mock_token_manager.get_access_token.side_effect = (f"token_{n}" for n in itertools.count(1))
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            # Simulate token manager that refreshes token
-            call_count = 0
-            def mock_get_token():
-                nonlocal call_count
-                call_count += 1
-                return f"token_{call_count}"
+        client = MSGraphClient(mock_token_manager)
+        
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = _OK_EMPTY_LIST
             
-            mock_token_manager.get_access_token.side_effect = mock_get_token
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
             
-            client = MSGraphClient(mock_token_manager)
+            # Make multiple calls to simulate token refresh
+            result1 = await client.list_emails(count=1)
+            result2 = await client.list_emails(count=1)
             
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 200
-                mock_response.is_success = True
-                mock_response.text = '{"value": []}'
-                mock_response.json.return_value = {"value": []}
-                
-                mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-                
-                # Make multiple calls to simulate token refresh
-                result1 = await client.list_emails(count=1)
-                result2 = await client.list_emails(count=1)
-                
-                # Check that token manager was called multiple times
-                if mock_token_manager.get_access_token.call_count >= 2:
-                    self._record_test_result(test_name, True, "✅ Token manager called for each request", start_time)
-                else:
-                    self._record_test_result(test_name, False, f"Token manager only called {mock_token_manager.get_access_token.call_count} times", start_time, severity="low")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+            # Check that token manager was called multiple times
+            if mock_token_manager.get_access_token.call_count >= 2:
+                self._record_test_result(test_name, True, "✅ Token manager called for each request", start_ns)
+            else:
+                self._record_test_result(test_name, False, f"Token manager only called {mock_token_manager.get_access_token.call_count} times", start_ns, severity="low")
     
     # =============================================================================
     # Email Operations Tests
@@ -1065,177 +974,115 @@ class MSGraphTestSuite:
         # Test 6.4: Invalid email IDs
         await self._test_invalid_email_ids()
     
-    async def _test_list_emails_parameters(self):
+    @_tracked("list_emails_parameters")
+    async def _test_list_emails_parameters(self, test_name: str, start_ns: int):
         """Test list emails with various parameters"""
-        start_time = datetime.now()
-        test_name = "list_emails_parameters"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = _OK_EMPTY_LIST
             
-            client = MSGraphClient(mock_token_manager)
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
             
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 200
-                mock_response.is_success = True
-                mock_response.text = '{"value": []}'
-                mock_response.json.return_value = {"value": []}
-                
-                mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-                
-                # Test various parameter combinations
-                test_cases = [
-                    {"folder": "inbox", "count": 10},
-                    {"folder": "sent", "count": 5},
-                    {"folder": "drafts", "count": 20, "select_fields": ["id", "subject"]},
-                ]
-                
-                successful_cases = 0
-                for test_case in test_cases:
-                    try:
-                        result = await client.list_emails(**test_case)
-                        if isinstance(result, dict):
-                            successful_cases += 1
-                    except Exception:
-                        pass
-                
-                if successful_cases == len(test_cases):
-                    self._record_test_result(test_name, True, "✅ Successfully handled all parameter combinations", start_time)
-                else:
-                    self._record_test_result(test_name, False, f"Only {successful_cases}/{len(test_cases)} parameter combinations worked", start_time, severity="medium")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+            # Test various parameter combinations
+            test_cases = [
+                {"folder": "inbox", "count": 10},
+                {"folder": "sent", "count": 5},
+                {"folder": "drafts", "count": 20, "select_fields": ["id", "subject"]},
+            ]
+            
+            successful_cases = 0
+            for test_case in test_cases:
+                try:
+                    result = await client.list_emails(**test_case)
+                    if isinstance(result, dict):
+                        successful_cases += 1
+                except Exception:
+                    pass
+            
+            if successful_cases == len(test_cases):
+                self._record_test_result(test_name, True, "✅ Successfully handled all parameter combinations", start_ns)
+            else:
+                self._record_test_result(test_name, False, f"Only {successful_cases}/{len(test_cases)} parameter combinations worked", start_ns, severity="medium")
     
-    async def _test_email_search(self):
+    @_tracked("email_search")
+    async def _test_email_search(self, test_name: str, start_ns: int):
         """Test email search functionality"""
-        start_time = datetime.now()
-        test_name = "email_search"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = _OK_EMPTY_LIST
             
-            client = MSGraphClient(mock_token_manager)
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
             
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 200
-                mock_response.is_success = True
-                mock_response.text = '{"value": []}'
-                mock_response.json.return_value = {"value": []}
-                
-                mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-                
-                # Test various search parameters
-                search_cases = [
-                    {"query": "test"},
-                    {"sender": "test@example.com"},
-                    {"subject_filter": "important"},
-                    {"has_attachments": True},
-                    {"unread_only": True},
-                    {"query": "project", "sender": "boss@company.com", "has_attachments": False}
-                ]
-                
-                successful_searches = 0
-                for search_case in search_cases:
-                    try:
-                        result = await client.search_emails(**search_case)
-                        if isinstance(result, dict):
-                            successful_searches += 1
-                    except Exception:
-                        pass
-                
-                if successful_searches >= len(search_cases) * 0.8:  # 80% success rate
-                    self._record_test_result(test_name, True, f"✅ Successfully handled {successful_searches}/{len(search_cases)} search cases", start_time)
-                else:
-                    self._record_test_result(test_name, False, f"Only {successful_searches}/{len(search_cases)} search cases worked", start_time, severity="medium")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+            # Test various search parameters
+            successful_searches = 0
+            for search_case in _SEARCH_CASES:
+                try:
+                    result = await client.search_emails(**search_case)
+                    if isinstance(result, dict):
+                        successful_searches += 1
+                except Exception:
+                    pass
+            
+            if successful_searches >= _SEARCH_THRESHOLD:
+                self._record_test_result(test_name, True, f"✅ Successfully handled {successful_searches}/{len(_SEARCH_CASES)} search cases", start_ns)
+            else:
+                self._record_test_result(test_name, False, f"Only {successful_searches}/{len(_SEARCH_CASES)} search cases worked", start_ns, severity="medium")
     
-    async def _test_read_email(self):
+    @_tracked("read_email")
+    async def _test_read_email(self, test_name: str, start_ns: int):
         """Test reading specific email"""
-        start_time = datetime.now()
-        test_name = "read_email"
-        
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
+        client = self._shared_client
+        
+        with patch('httpx.AsyncClient') as mock_client:
+            email_data = {
+                "id": "test_email_id",
+                "subject": "Test Email",
+                "body": {"content": "Test content"},
+                "from": {"emailAddress": {"address": "sender@example.com"}}
+            }
+            mock_response = FakeResponse(
+                status_code=200,
+                is_success=True,
+                # Serialized form of email_data, spelled out so no encoder runs per test
+                text='{"id": "test_email_id", "subject": "Test Email", "body": {"content": "Test content"}, "from": {"emailAddress": {"address": "sender@example.com"}}}',
+                payload=email_data,
+            )
             
-            client = MSGraphClient(mock_token_manager)
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
             
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 200
-                mock_response.is_success = True
-                email_data = {
-                    "id": "test_email_id",
-                    "subject": "Test Email",
-                    "body": {"content": "Test content"},
-                    "from": {"emailAddress": {"address": "sender@example.com"}}
-                }
-                mock_response.text = json.dumps(email_data)
-                mock_response.json.return_value = email_data
-                
-                mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-                
-                result = await client.read_email("test_email_id")
-                
-                if isinstance(result, dict) and result.get("id") == "test_email_id":
-                    self._record_test_result(test_name, True, "✅ Successfully read email content", start_time)
-                else:
-                    self._record_test_result(test_name, False, f"Unexpected result: {result}", start_time, severity="medium")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+            result = await client.read_email("test_email_id")
+            
+            if isinstance(result, dict) and result.get("id") == "test_email_id":
+                self._record_test_result(test_name, True, "✅ Successfully read email content", start_ns)
+            else:
+                self._record_test_result(test_name, False, f"Unexpected result: {result}", start_ns, severity="medium")
     
-    async def _test_invalid_email_ids(self):
+    @_tracked("invalid_email_ids")
+    async def _test_invalid_email_ids(self, test_name: str, start_ns: int):
         """Test invalid email ID handling"""
-        start_time = datetime.now()
-        test_name = "invalid_email_ids"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
-            
-            client = MSGraphClient(mock_token_manager)
-            
-            invalid_ids = ["", "invalid-id", "nonexistent-id", None]
-            handled_correctly = 0
-            
-            for invalid_id in invalid_ids:
-                with patch('httpx.AsyncClient') as mock_client:
-                    mock_response = Mock()
-                    mock_response.status_code = 404
-                    mock_response.is_success = False
-                    mock_response.text = "Email not found"
-                    mock_response.json.return_value = {"error": {"message": "Email not found"}}
-                    
-                    mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-                    
-                    try:
-                        if invalid_id is None or invalid_id == "":
-                            # These should fail before API call
-                            continue
-                        await client.read_email(invalid_id)
-                    except GraphAPIError as e:
-                        if e.status_code == 404:
-                            handled_correctly += 1
-                    except Exception:
-                        handled_correctly += 1  # Other exceptions are acceptable
+        handled_correctly = 0
+        
+        # Every lookup gets the same 404, so patch once for all IDs
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=_NOT_FOUND_404)
             
-            # Adjust expected count for None/empty cases
-            expected_count = len([id for id in invalid_ids if id])
-            if handled_correctly >= expected_count * 0.8:  # 80% success rate
-                self._record_test_result(test_name, True, f"✅ Handled {handled_correctly}/{expected_count} invalid IDs correctly", start_time)
-            else:
-                self._record_test_result(test_name, False, f"Only handled {handled_correctly}/{expected_count} invalid IDs", start_time, severity="medium")
-                
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+            for invalid_id in _INVALID_EMAIL_IDS:
+                try:
+                    await client.read_email(invalid_id)
+                except GraphAPIError as e:
+                    if e.status_code == 404:
+                        handled_correctly += 1
+                except Exception:
+                    handled_correctly += 1  # Other exceptions are acceptable
+        
+        if handled_correctly >= _INVALID_EMAIL_ID_THRESHOLD:
+            self._record_test_result(test_name, True, f"✅ Handled {handled_correctly}/{len(_INVALID_EMAIL_IDS)} invalid IDs correctly", start_ns)
+        else:
+            self._record_test_result(test_name, False, f"Only handled {handled_correctly}/{len(_INVALID_EMAIL_IDS)} invalid IDs", start_ns, severity="medium")
     
     # =============================================================================
     # Edge Case Tests
@@ -1257,134 +1104,91 @@ class MSGraphTestSuite:
         # Test 7.4: API version compatibility
         await self._test_api_version_compatibility()
     
-    async def _test_concurrent_requests(self):
+    @_tracked("concurrent_requests")
+    async def _test_concurrent_requests(self, test_name: str, start_ns: int):
         """Test concurrent requests handling"""
-        start_time = datetime.now()
-        test_name = "concurrent_requests"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = _OK_EMPTY_LIST
             
-            client = MSGraphClient(mock_token_manager)
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
             
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 200
-                mock_response.is_success = True
-                mock_response.text = '{"value": []}'
-                mock_response.json.return_value = {"value": []}
-                
-                mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-                
-                # Run multiple concurrent requests
-                tasks = [client.list_emails(count=1) for _ in range(5)]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                successful_requests = sum(1 for r in results if isinstance(r, dict))
-                
-                if successful_requests >= len(tasks) * 0.8:  # 80% success rate
-                    self._record_test_result(test_name, True, f"✅ Handled {successful_requests}/{len(tasks)} concurrent requests", start_time)
-                else:
-                    self._record_test_result(test_name, False, f"Only {successful_requests}/{len(tasks)} concurrent requests succeeded", start_time, severity="medium")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+            # Run multiple concurrent requests
+            tasks = [client.list_emails(count=1) for _ in range(_CONCURRENT_REQUESTS)]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            successful_requests = sum(1 for r in results if isinstance(r, dict))
+            
+            if successful_requests >= _CONCURRENT_THRESHOLD:
+                self._record_test_result(test_name, True, f"✅ Handled {successful_requests}/{_CONCURRENT_REQUESTS} concurrent requests", start_ns)
+            else:
+                self._record_test_result(test_name, False, f"Only {successful_requests}/{_CONCURRENT_REQUESTS} concurrent requests succeeded", start_ns, severity="medium")
     
-    async def _test_unicode_content(self):
+    @_tracked("unicode_content")
+    async def _test_unicode_content(self, test_name: str, start_ns: int):
         """Test Unicode content handling"""
-        start_time = datetime.now()
-        test_name = "unicode_content"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
-            
-            client = MSGraphClient(mock_token_manager)
+        unicode_content = {
+            "subject": "Test 中文 Русские العربية 日本語 🎯",
+            "body": "Content with various Unicode: ∑∆∏∂∫√≈≠≤≥ émojis 🚀📧✅"
+        }
+        
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = _ACCEPTED_202
             
-            unicode_content = {
-                "subject": "Test 中文 Русские العربية 日本語 🎯",
-                "body": "Content with various Unicode: ∑∆∏∂∫√≈≠≤≥ émojis 🚀📧✅"
-            }
+            mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
             
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 202
-                mock_response.is_success = True
-                mock_response.text = ""
+            with patch('clients.graph_api_client.EmailValidator') as mock_validator:
+                mock_validator.format_recipients.return_value = [{"emailAddress": {"address": "test@example.com", "name": "Test User"}}]
                 
-                mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+                result = await client.send_email(
+                    to="test@example.com",
+                    **unicode_content
+                )
                 
-                with patch('clients.graph_api_client.EmailValidator') as mock_validator:
-                    mock_validator.format_recipients.return_value = [{"emailAddress": {"address": "test@example.com", "name": "Test User"}}]
-                    
-                    result = await client.send_email(
-                        to="test@example.com",
-                        **unicode_content
-                    )
-                    
-                    if result.success:
-                        self._record_test_result(test_name, True, "✅ Handled Unicode content successfully", start_time)
-                    else:
-                        self._record_test_result(test_name, False, f"Failed to handle Unicode content: {result.error}", start_time, severity="medium")
-                    
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+                if result.success:
+                    self._record_test_result(test_name, True, "✅ Handled Unicode content successfully", start_ns)
+                else:
+                    self._record_test_result(test_name, False, f"Failed to handle Unicode content: {result.error}", start_ns, severity="medium")
     
-    async def _test_malformed_json(self):
+    @_tracked("malformed_json")
+    async def _test_malformed_json(self, test_name: str, start_ns: int):
         """Test malformed JSON response handling"""
-        start_time = datetime.now()
-        test_name = "malformed_json"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.is_success = True
+            mock_response.text = '{"invalid": json, "missing": "quotes"}'  # Malformed JSON
+            mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
             
-            client = MSGraphClient(mock_token_manager)
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
             
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 200
-                mock_response.is_success = True
-                mock_response.text = '{"invalid": json, "missing": "quotes"}'  # Malformed JSON
-                mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-                
-                mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-                
-                try:
-                    result = await client.list_emails(count=1)
-                    self._record_test_result(test_name, False, "Should have raised exception for malformed JSON", start_time, severity="medium")
-                except json.JSONDecodeError:
-                    self._record_test_result(test_name, True, "✅ Correctly handled malformed JSON", start_time)
-                except Exception as e:
-                    if "json" in str(e).lower():
-                        self._record_test_result(test_name, True, "✅ Handled JSON error appropriately", start_time)
-                    else:
-                        self._record_test_result(test_name, False, f"Unexpected error: {str(e)}", start_time, severity="medium")
-                        
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+            try:
+                result = await client.list_emails(count=1)
+                self._record_test_result(test_name, False, "Should have raised exception for malformed JSON", start_ns, severity="medium")
+            except json.JSONDecodeError:
+                self._record_test_result(test_name, True, "✅ Correctly handled malformed JSON", start_ns)
+            except Exception as e:
+                if "json" in str(e).lower():
+                    self._record_test_result(test_name, True, "✅ Handled JSON error appropriately", start_ns)
+                else:
+                    self._record_test_result(test_name, False, f"Unexpected error: {str(e)}", start_ns, severity="medium")
     
-    async def _test_api_version_compatibility(self):
+    @_tracked("api_version_compatibility")
+    async def _test_api_version_compatibility(self, test_name: str, start_ns: int):
         """Test API version compatibility"""
-        start_time = datetime.now()
-        test_name = "api_version_compatibility"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
-            
-            client = MSGraphClient(mock_token_manager)
-            
-            # Verify base URL includes correct API version
-            expected_base_url = "https://graph.microsoft.com/v1.0"
-            if client.base_url == expected_base_url:
-                self._record_test_result(test_name, True, "✅ Using correct API version (v1.0)", start_time)
-            else:
-                self._record_test_result(test_name, False, f"Unexpected base URL: {client.base_url}", start_time, severity="medium")
-                
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test setup failed: {str(e)}", start_time, severity="medium")
+        # Verify base URL includes correct API version
+        expected_base_url = "https://graph.microsoft.com/v1.0"
+        if client.base_url == expected_base_url:
+            self._record_test_result(test_name, True, "✅ Using correct API version (v1.0)", start_ns)
+        else:
+            self._record_test_result(test_name, False, f"Unexpected base URL: {client.base_url}", start_ns, severity="medium")
     
     # =============================================================================
     # Performance Tests
@@ -1403,127 +1207,109 @@ class MSGraphTestSuite:
         # Test 8.3: Resource cleanup
         await self._test_resource_cleanup()
     
-    async def _test_response_times(self):
+    @_tracked("response_times", message_prefix="Test failed")
+    async def _test_response_times(self, test_name: str, start_ns: int):
         """Test response times under various conditions"""
-        start_time = datetime.now()
-        test_name = "response_times"
+        client = self._shared_client
         
-        try:
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
-            
-            client = MSGraphClient(mock_token_manager)
-            
-            response_times = []
+        response_times = []
+        
+        # Test multiple API calls; every call gets the same response, so patch once
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=_OK_EMPTY_LIST)
             
-            # Test multiple API calls
             for i in range(5):
-                with patch('httpx.AsyncClient') as mock_client:
-                    mock_response = Mock()
-                    mock_response.status_code = 200
-                    mock_response.is_success = True
-                    mock_response.text = '{"value": []}'
-                    mock_response.json.return_value = {"value": []}
-                    
-                    mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-                    
-                    call_start = datetime.now()
-                    result = await client.list_emails(count=10)
-                    call_time = (datetime.now() - call_start).total_seconds()
-                    response_times.append(call_time)
-            
-            avg_response_time = sum(response_times) / len(response_times)
-            max_response_time = max(response_times)
-            
-            if avg_response_time < 0.5 and max_response_time < 2.0:  # Average < 0.5s, Max < 2s
-                self._record_test_result(test_name, True, f"✅ Response times acceptable (avg: {avg_response_time:.3f}s, max: {max_response_time:.3f}s)", start_time)
-            else:
-                self._record_test_result(test_name, False, f"Slow response times (avg: {avg_response_time:.3f}s, max: {max_response_time:.3f}s)", start_time, severity="medium")
-                
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test failed: {str(e)}", start_time, severity="medium")
+                call_start = time.perf_counter()
+                result = await client.list_emails(count=10)
+                call_time = time.perf_counter() - call_start
+                response_times.append(call_time)
+        
+        avg_response_time = sum(response_times) / len(response_times)
+        max_response_time = max(response_times)
+        
+        if avg_response_time < 0.5 and max_response_time < 2.0:  # Average < 0.5s, Max < 2s
+            self._record_test_result(test_name, True, f"✅ Response times acceptable (avg: {avg_response_time:.3f}s, max: {max_response_time:.3f}s)", start_ns)
+        else:
+            self._record_test_result(test_name, False, f"Slow response times (avg: {avg_response_time:.3f}s, max: {max_response_time:.3f}s)", start_ns, severity="medium")
     
-    async def _test_memory_usage(self):
+    @_tracked("memory_usage", message_prefix="Test failed")
+    async def _test_memory_usage(self, test_name: str, start_ns: int):
         """Test memory usage with large emails"""
-        start_time = datetime.now()
-        test_name = "memory_usage"
+        client = self._shared_client
+        
+        # The response is identical for every operation, so its payload is
+        # built and serialized once. That happens before tracing starts, so
+        # only the client's handling of the three responses is measured
+        large_email_data = {
+            "value": [
+                {
+                    "id": f"email_{j}",
+                    "subject": f"Large Email {j}",
+                    "body": {"content": "A" * 10000},  # 10KB content per email
+                    "from": {"emailAddress": {"address": f"sender{j}@example.com"}}
+                }
+                for j in range(100)  # 100 emails
+            ]
+        }
+        mock_response = FakeResponse(
+            status_code=200,
+            is_success=True,
+            text=_dumps(large_email_data),
+            payload=large_email_data,
+        )
+        
+        # tracemalloc accounts Python allocations exactly, unlike process
+        # RSS which moves with allocator caching and page reclamation. If
+        # something else is already tracing, its peak is left alone and the
+        # net change between two snapshots is measured instead
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+            initial_bytes = tracemalloc.get_traced_memory()[0]
+        else:
+            initial_snapshot = tracemalloc.take_snapshot().filter_traces(_TRACEMALLOC_FILTERS)
         
         try:
-            try:
-                import psutil
-                import os
-                
-                process = psutil.Process(os.getpid())
-                initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-                
-                mock_token_manager = Mock(spec=MSGraphTokenManager)
-                mock_token_manager.get_access_token.return_value = "valid_token"
-                
-                client = MSGraphClient(mock_token_manager)
+            # Process multiple large email operations under a single patch
+            with patch('httpx.AsyncClient') as mock_client:
+                mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
                 
-                # Process multiple large email operations
                 for i in range(3):
-                    large_email_data = {
-                        "value": [
-                            {
-                                "id": f"email_{j}",
-                                "subject": f"Large Email {j}",
-                                "body": {"content": "A" * 10000},  # 10KB content per email
-                                "from": {"emailAddress": {"address": f"sender{j}@example.com"}}
-                            }
-                            for j in range(100)  # 100 emails
-                        ]
-                    }
-                    
-                    with patch('httpx.AsyncClient') as mock_client:
-                        mock_response = Mock()
-                        mock_response.status_code = 200
-                        mock_response.is_success = True
-                        mock_response.text = json.dumps(large_email_data)
-                        mock_response.json.return_value = large_email_data
-                        
-                        mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-                        
-                        result = await client.list_emails(count=50)
-                        del result  # Explicit cleanup
-                
-                final_memory = process.memory_info().rss / 1024 / 1024  # MB
-                memory_increase = final_memory - initial_memory
-                
-                if memory_increase < 50:  # Less than 50MB increase
-                    self._record_test_result(test_name, True, f"✅ Memory usage acceptable ({memory_increase:.2f}MB increase)", start_time)
-                else:
-                    self._record_test_result(test_name, False, f"High memory usage ({memory_increase:.2f}MB increase)", start_time, severity="medium")
-                    
-            except ImportError:
-                self._record_test_result(test_name, False, "psutil not available for memory testing", start_time, severity="low")
-                
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test failed: {str(e)}", start_time, severity="medium")
+                    result = await client.list_emails(count=50)
+                    del result  # Explicit cleanup
+            
+            if started_tracing:
+                increase_bytes = tracemalloc.get_traced_memory()[1] - initial_bytes
+            else:
+                final_snapshot = tracemalloc.take_snapshot().filter_traces(_TRACEMALLOC_FILTERS)
+                increase_bytes = sum(stat.size_diff for stat in final_snapshot.compare_to(initial_snapshot, "filename"))
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+        
+        memory_increase = increase_bytes / 1024 / 1024  # MB
+        
+        if memory_increase < 50:  # Less than 50MB increase
+            self._record_test_result(test_name, True, f"✅ Memory usage acceptable ({memory_increase:.2f}MB increase)", start_ns)
+        else:
+            self._record_test_result(test_name, False, f"High memory usage ({memory_increase:.2f}MB increase)", start_ns, severity="medium")
     
-    async def _test_resource_cleanup(self):
+    @_tracked("resource_cleanup", message_prefix="Test failed")
+    async def _test_resource_cleanup(self, test_name: str, start_ns: int):
         """Test proper resource cleanup"""
-        start_time = datetime.now()
-        test_name = "resource_cleanup"
-        
-        try:
-            # Test that temp files are cleaned up
-            initial_files = set(os.listdir(self.temp_dir)) if os.path.exists(self.temp_dir) else set()
-            
-            mock_token_manager = Mock(spec=MSGraphTokenManager)
-            mock_token_manager.get_access_token.return_value = "valid_token"
+        # Test that temp files are cleaned up; the scratch directory only
+        # exists for the duration of this check
+        with tempfile.TemporaryDirectory(prefix="msgraph_test_") as temp_dir:
+            with os.scandir(temp_dir) as entries:
+                initial_files = {entry.name for entry in entries}
             
-            client = MSGraphClient(mock_token_manager)
+            client = self._shared_client
             
             # Simulate operations that might create temp files
             with patch('httpx.AsyncClient') as mock_client:
-                mock_response = Mock()
-                mock_response.status_code = 200
-                mock_response.is_success = True
-                mock_response.text = '{"value": []}'
-                mock_response.json.return_value = {"value": []}
+                mock_response = _OK_EMPTY_LIST
                 
-                mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+                mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
                 
                 # Multiple operations
                 for i in range(5):
@@ -1531,25 +1317,23 @@ class MSGraphTestSuite:
                     del result
             
             # Check for resource leaks (simplified)
-            final_files = set(os.listdir(self.temp_dir)) if os.path.exists(self.temp_dir) else set()
+            with os.scandir(temp_dir) as entries:
+                final_files = {entry.name for entry in entries}
             new_files = final_files - initial_files
-            
-            if len(new_files) == 0:
-                self._record_test_result(test_name, True, "✅ No resource leaks detected", start_time)
-            else:
-                self._record_test_result(test_name, False, f"Potential resource leak: {len(new_files)} new files", start_time, severity="low")
-                
-        except Exception as e:
-            self._record_test_result(test_name, False, f"Test failed: {str(e)}", start_time, severity="medium")
+        
+        if len(new_files) == 0:
+            self._record_test_result(test_name, True, "✅ No resource leaks detected", start_ns)
+        else:
+            self._record_test_result(test_name, False, f"Potential resource leak: {len(new_files)} new files", start_ns, severity="low")
     
     # =============================================================================
     # Helper Methods
     # =============================================================================
     
-    def _record_test_result(self, test_name: str, passed: bool, message: str, start_time: datetime, 
+    def _record_test_result(self, test_name: str, passed: bool, message: str, start_ns: int, 
                            error_details: Optional[str] = None, severity: str = "medium"):
         """Record individual test result"""
-        execution_time = int((datetime.now() - start_time).total_seconds() * 1000)
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
         
         result = TestResult(
             test_name=test_name,
@@ -1560,44 +1344,30 @@ class MSGraphTestSuite:
             severity=severity
         )
         
-        self.test_results.append(result)
+        self._append_result(result)
+        self._counters["passed" if passed else "failed"] += 1
+        if not passed and severity == "critical":
+            self._counters["critical"] += 1
         
         # Log result
         status = "✅ PASS" if passed else "❌ FAIL"
-        logger.info(f"   {status} | {test_name} | {message} ({execution_time}ms)")
+        self._log(f"   {status} | {test_name} | {message} ({execution_time}ms)")
         
         if not passed and severity in ["high", "critical"]:
             logger.error(f"      ⚠️  {severity.upper()} SEVERITY: {message}")
     
     def _get_test_category(self, test_name: str) -> str:
         """Get test category for easier debugging"""
-        if any(x in test_name for x in ["http_status", "empty_responses", "rate_limiting", "timeout", "request_methods"]):
-            return "API Client Functionality"
-        elif any(x in test_name for x in ["email_sending", "multiple_recipients", "content_types", "importance", "large_email"]):
-            return "Email Sending Scenarios"
-        elif any(x in test_name for x in ["invalid_email", "missing_required", "special_characters", "validation"]):
-            return "Data Validation"
-        elif any(x in test_name for x in ["connection_timeout", "dns_failure", "ssl_errors", "intermittent"]):
-            return "Network Resilience"
-        elif any(x in test_name for x in ["expired_token", "invalid_token", "token_refresh"]):
-            return "Authentication Scenarios"
-        elif any(x in test_name for x in ["list_emails", "email_search", "read_email", "invalid_email_ids"]):
-            return "Email Operations"
-        elif any(x in test_name for x in ["concurrent", "unicode", "malformed", "api_version"]):
-            return "Edge Cases"
-        elif any(x in test_name for x in ["response_times", "memory_usage", "resource_cleanup"]):
-            return "Performance Scenarios"
-        else:
-            return "Other"
+        return _TEST_CATEGORIES.get(test_name, "Other")
     
     def _generate_report(self) -> TestSuiteReport:
         """Generate comprehensive test suite report"""
         end_time = datetime.now()
-        execution_time = int((end_time - self.start_time).total_seconds() * 1000)
+        execution_time = (time.perf_counter_ns() - self._start_ns) // 1_000_000
         
-        passed_tests = sum(1 for r in self.test_results if r.passed)
-        failed_tests = len(self.test_results) - passed_tests
-        critical_failures = sum(1 for r in self.test_results if not r.passed and r.severity == "critical")
+        passed_tests = self._counters["passed"]
+        failed_tests = self._counters["failed"]
+        critical_failures = self._counters["critical"]
         
         # Determine overall status
         if critical_failures > 0:
@@ -1624,44 +1394,48 @@ class MSGraphTestSuite:
             recommendations=recommendations
         )
         
-        # Log summary
-        logger.info("="*80)
-        logger.info("📊 TEST SUITE SUMMARY")
-        logger.info("="*80)
-        logger.info(f"Overall Status: {overall_status}")
-        logger.info(f"Total Tests: {report.total_tests}")
-        logger.info(f"Passed: {report.passed_tests}")
-        logger.info(f"Failed: {report.failed_tests}")
-        logger.info(f"Critical Failures: {report.critical_failures}")
-        logger.info(f"Execution Time: {execution_time/1000:.2f}s")
-        
-        # Log detailed failure summary
+        # Log summary as a single record so the whole block is handed to the
+        # log listener in one write
+        summary_lines = [
+            "="*80,
+            "📊 TEST SUITE SUMMARY",
+            "="*80,
+            f"Overall Status: {overall_status}",
+            f"Total Tests: {report.total_tests}",
+            f"Passed: {report.passed_tests}",
+            f"Failed: {report.failed_tests}",
+            f"Critical Failures: {report.critical_failures}",
+            f"Execution Time: {execution_time/1000:.2f}s",
+        ]
+        
+        # Detailed failure summary
         failed_results = [r for r in self.test_results if not r.passed]
         if failed_results:
-            logger.info("\n" + "="*80)
-            logger.info("🚨 DETAILED FAILURE SUMMARY")
-            logger.info("="*80)
+            summary_lines += ["\n" + "="*80, "🚨 DETAILED FAILURE SUMMARY", "="*80]
             for i, failure in enumerate(failed_results, 1):
-                logger.info(f"\n❌ FAILURE #{i}: {failure.test_name}")
-                logger.info(f"   Suite: MSGraph Test Suite")
-                logger.info(f"   Category: {self._get_test_category(failure.test_name)}")
-                logger.info(f"   Severity: {failure.severity.upper()}")
-                logger.info(f"   Message: {failure.message}")
-                logger.info(f"   Execution Time: {failure.execution_time_ms}ms")
+                summary_lines += [
+                    f"\n❌ FAILURE #{i}: {failure.test_name}",
+                    "   Suite: MSGraph Test Suite",
+                    f"   Category: {self._get_test_category(failure.test_name)}",
+                    f"   Severity: {failure.severity.upper()}",
+                    f"   Message: {failure.message}",
+                    f"   Execution Time: {failure.execution_time_ms}ms",
+                ]
                 if failure.error_details:
-                    logger.info(f"   Error Details: {failure.error_details}")
-                logger.info("   " + "-"*60)
+                    summary_lines.append(f"   Error Details: {failure.error_details}")
+                summary_lines.append("   " + "-"*60)
         
         if recommendations:
-            logger.info("\n📋 RECOMMENDATIONS:")
-            for i, rec in enumerate(recommendations, 1):
-                logger.info(f"  {i}. {rec}")
+            summary_lines.append("\n📋 RECOMMENDATIONS:")
+            summary_lines.extend(f"  {i}. {rec}" for i, rec in enumerate(recommendations, 1))
         
-        # Save detailed report
-        try:
-            report_file = f"logs/msgraph-test-report-{end_time.strftime('%Y%m%d_%H%M%S')}.json"
-            with open(report_file, 'w') as f:
-                json.dump({
+        logger.info("\n".join(summary_lines))
+        
+        # Save detailed report when requested
+        if self.write_report:
+            try:
+                report_file = f"logs/msgraph-test-report-{end_time.strftime('%Y%m%d_%H%M%S')}.json"
+                _write_report(report_file, {
                     "summary": {
                         "timestamp": report.timestamp,
                         "overall_status": report.overall_status,
@@ -1671,22 +1445,12 @@ class MSGraphTestSuite:
                         "critical_failures": report.critical_failures,
                         "execution_time_ms": report.execution_time_ms
                     },
-                    "test_results": [
-                        {
-                            "test_name": r.test_name,
-                            "passed": r.passed,
-                            "message": r.message,
-                            "execution_time_ms": r.execution_time_ms,
-                            "error_details": r.error_details,
-                            "severity": r.severity
-                        }
-                        for r in report.test_results
-                    ],
+                    "test_results": report.test_results,
                     "recommendations": report.recommendations
-                }, f, indent=2)
-            logger.info(f"📄 Detailed report saved: {report_file}")
-        except Exception as e:
-            logger.warning(f"⚠️  Failed to save report: {e}")
+                })
+                logger.info(f"📄 Detailed report saved: {report_file}")
+            except Exception as e:
+                logger.warning(f"⚠️  Failed to save report: {e}")
         
         return report
     
@@ -1694,38 +1458,31 @@ class MSGraphTestSuite:
         """Generate recommendations based on test results"""
         recommendations = []
         
+        # Note which areas have a failing test in a single pass over the results
+        failing_areas = set()
+        for r in self.test_results:
+            if r.passed:
+                continue
+            name = r.test_name.lower()
+            for area, (keys, _) in enumerate(_RECOMMENDATION_AREAS):
+                if any(key in name for key in keys):
+                    failing_areas.add(area)
+        
         # Critical failures
-        critical_failures = [r for r in self.test_results if not r.passed and r.severity == "critical"]
+        critical_failures = self._counters["critical"]
         if critical_failures:
-            recommendations.append(f"🚨 Address {len(critical_failures)} critical failures before production deployment")
-        
-        # Authentication issues
-        auth_failures = [r for r in self.test_results if not r.passed and "auth" in r.test_name.lower()]
-        if auth_failures:
-            recommendations.append("🔐 Review authentication error handling and token management")
-        
-        # Network resilience
-        network_failures = [r for r in self.test_results if not r.passed and ("network" in r.test_name.lower() or "timeout" in r.test_name.lower())]
-        if network_failures:
-            recommendations.append("🌐 Implement retry logic and better network error handling")
+            recommendations.append(f"🚨 Address {critical_failures} critical failures before production deployment")
         
-        # Email sending issues
-        email_failures = [r for r in self.test_results if not r.passed and ("email" in r.test_name.lower() or "send" in r.test_name.lower())]
-        if email_failures:
-            recommendations.append("📧 Review email sending logic and recipient validation")
-        
-        # Validation issues
-        validation_failures = [r for r in self.test_results if not r.passed and ("validation" in r.test_name.lower() or "invalid" in r.test_name.lower())]
-        if validation_failures:
-            recommendations.append("📊 Strengthen input validation and data sanitization")
-        
-        # Performance concerns
-        performance_failures = [r for r in self.test_results if not r.passed and ("performance" in r.test_name.lower() or "memory" in r.test_name.lower())]
-        if performance_failures:
-            recommendations.append("⚡ Optimize performance and memory usage for large operations")
+        # Authentication, network, email, validation and performance issues
+        recommendations.extend(
+            recommendation
+            for area, (_, recommendation) in enumerate(_RECOMMENDATION_AREAS)
+            if area in failing_areas
+        )
         
         # High failure rate
-        failure_rate = len([r for r in self.test_results if not r.passed]) / len(self.test_results)
+        total_tests = len(self.test_results)
+        failure_rate = self._counters["failed"] / total_tests if total_tests else 0.0
         if failure_rate > 0.3:
             recommendations.append("🛠️  High failure rate detected - consider comprehensive code review")
         
@@ -1739,10 +1496,10 @@ class MSGraphTestSuite:
 # Main Execution
 # =============================================================================
 
-async def run_msgraph_tests() -> TestSuiteReport:
+async def run_msgraph_tests(write_report: Optional[bool] = None) -> TestSuiteReport:
     """Run the comprehensive Microsoft Graph API test suite"""
     logger.info("🚀 Starting Microsoft Graph API Workflow Test Suite")
-    test_suite = MSGraphTestSuite()
+    test_suite = MSGraphTestSuite(write_report=write_report)
     return await test_suite.run_all_tests()
 
 
@@ -1765,4 +1522,12 @@ if __name__ == "__main__":
         
         return report.overall_status == "PASS"
     
+    # The suite is dominated by event-loop scheduling of mocked awaits, so use
+    # uvloop's cheaper loop when it is installed (optional dependency)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file